@@ -32,6 +32,7 @@ def example_usage():
         print(f"   Pages processed: {len(requirements)}")
         print(f"   Total requirements: {sum(len(r) for r in requirements.values())}")
         print(f"   Total comments: {sum(len(c) for c in comments.values())}")
+        print(f"   Headings: {len(parser.filter_requirements('heading'))}")
         print(f"   Output: JSON files + Markdown document")
 
     except FileNotFoundError:
@@ -89,6 +90,9 @@ def example_usage():
     print("Example 3: Filtering Requirements by Type")
     print("=" * 60)
 
+    # On a parsed PDF, parser.filter_requirements('heading') and
+    # parser.filter_comments(author) perform these filters directly
+
     # Filter headings
     headings = [
         req for page_reqs in sample_requirements.values()
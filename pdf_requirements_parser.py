@@ -10,103 +10,936 @@ Supports both text-based and scanned PDFs with OCR capabilities.
 """
 
 import argparse
+import bisect
+import hashlib
 import json
+import os
+import queue
+import re
 import sys
+import traceback
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, Iterable, Iterator, List, Any, Optional, Tuple
 import warnings
 
 # Core PDF libraries
-import PyPDF2
+import pymupdf
 import pdfplumber
+from tqdm import tqdm
 
 # OCR libraries
 try:
-    import pytesseract
-    from PIL import Image
+    from tesserocr import PyTessBaseAPI, OEM, PSM
+    from PIL import Image, ImageOps
     OCR_AVAILABLE = True
 except ImportError:
     OCR_AVAILABLE = False
     warnings.warn("OCR libraries not available. Scanned PDFs cannot be processed.")
 
+# Fast JSON serialization, falling back to the standard library
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# Inline Word-style comments, e.g. "Commented [AK1]: comment text"
+_COMMENT_MARKER = 'Commented ['
+_RE_COMMENT_ANY = re.compile(r'Commented \[[^\]]+\](?::[^\n]*)?')
+
+# A comment starting a line, plus its continuation lines up to the next
+# blank line, comment or requirement marker (bullets, field names, ...)
+_RE_INLINE_BLOCK = re.compile(
+    r'^Commented \[([^\]\n]+)\]:[^\S\n]*(.*?)'
+    r'(?=\n[^\S\n]*(?:\n|\Z|Commented \[|[•▪]|Field Name|Is Active|User Story|Campaign Details'
+    r'|(?:o|Name) (?=[^\n]*\S))|\Z)',
+    re.MULTILINE | re.DOTALL
+)
+
+# Runs of three or more newlines, collapsed to a single blank line
+_RE_BLANKS = re.compile(r'\n{3,}')
+
+# Section boundaries: bullet points and short capitalised heading lines
+_RE_BULLET = re.compile(r'(?=^•\s)', re.MULTILINE)
+_RE_HEADING = re.compile(r'(?=^[A-Z][^\n]{0,80}$)', re.MULTILINE)
+
+# Content classification probes applied to a section's first line
+_RE_FIELD = re.compile(r'Field Name|Field List|Description|Data Type')
+_RE_LIST_START = re.compile(r'[•\-*◦▪]|\d.{0,3}\.')
+
+
+# Fields of requirement and comment objects, in output order
+_REQUIREMENT_FIELDS = ("id", "type", "text", "line_count")
+_COMMENT_FIELDS = ("id", "page", "type", "author", "text", "subject", "color")
+
+
+# Character grouping tolerances (in points) used when rebuilding text lines,
+# matching pdfplumber's extract_text defaults
+_X_TOLERANCE = 3
+_Y_TOLERANCE = 3
+
+
+# Bump whenever the shape of the parsed page output changes so stale
+# cache entries are ignored
+_CACHE_VERSION = 3
+
+
+# Tesseract configuration for scanned pages: LSTM engine only, and treat
+# each page as a single block of text to skip the legacy engine and full
+# layout analysis. Recorded with the OCR resolution in the cache entries
+# of OCR'd pages, so changing any of them re-OCRs those pages
+_OCR_LANG = 'eng'
+_OCR_PSM = 'SINGLE_BLOCK'
+_OCR_OEM = 'LSTM_ONLY'
+
+
+# Open PyMuPDF documents, keyed by (process id, path), so each worker
+# process opens the PDF once and reuses the handle for all of its pages
+_WORKER_DOCUMENTS: Dict[Tuple[int, str], pymupdf.Document] = {}
+
+# pdfplumber handles for the text fallback, opened lazily under the same
+# keys since most PDFs never need them
+_WORKER_PLUMBER_DOCUMENTS: Dict[Tuple[int, str], pdfplumber.PDF] = {}
+
+
+def _get_worker_document(pdf_path: Path) -> pymupdf.Document:
+    """
+    Return the current process's PyMuPDF handle for a PDF, opening it on first use.
+
+    Args:
+        pdf_path: Path to the PDF file
+
+    Returns:
+        Opened PyMuPDF document
+    """
+    key = (os.getpid(), str(pdf_path))
+    doc = _WORKER_DOCUMENTS.get(key)
+    if doc is None:
+        doc = pymupdf.open(str(pdf_path))
+        _WORKER_DOCUMENTS[key] = doc
+    return doc
+
+
+def _get_worker_plumber_document(pdf_path: Path) -> pdfplumber.PDF:
+    """
+    Return the current process's pdfplumber handle for a PDF, opening it on first use.
+
+    Args:
+        pdf_path: Path to the PDF file
+
+    Returns:
+        Opened pdfplumber document
+    """
+    key = (os.getpid(), str(pdf_path))
+    plumber_pdf = _WORKER_PLUMBER_DOCUMENTS.get(key)
+    if plumber_pdf is None:
+        plumber_pdf = pdfplumber.open(pdf_path)
+        _WORKER_PLUMBER_DOCUMENTS[key] = plumber_pdf
+    return plumber_pdf
+
+
+def _close_worker_document(pdf_path: Path):
+    """
+    Close the current process's PyMuPDF and pdfplumber handles for a PDF, if open.
+
+    Args:
+        pdf_path: Path to the PDF file
+    """
+    key = (os.getpid(), str(pdf_path))
+    doc = _WORKER_DOCUMENTS.pop(key, None)
+    if doc is not None:
+        doc.close()
+    plumber_pdf = _WORKER_PLUMBER_DOCUMENTS.pop(key, None)
+    if plumber_pdf is not None:
+        plumber_pdf.close()
+
+
+def _layout_page_text(page: pymupdf.Page) -> str:
+    """
+    Rebuild a page's text lines, approximating pdfplumber's extract_text.
+
+    PyMuPDF's plain text output puts every table cell and bullet glyph on its
+    own line, which breaks the line-based section splitting. Instead, group
+    characters into lines by their top edge, using pdfminer's glyph box
+    (baseline descent plus font size), then into words on whitespace or
+    horizontal gaps.
+
+    This only approximates pdfplumber for horizontal text: the descent comes
+    from PyMuPDF's font metrics, which can differ from pdfminer's (e.g. for
+    the standard 14 fonts), so text in different sizes on one baseline may
+    be grouped differently, and rotated or vertical text keeps PyMuPDF's
+    reading order.
+
+    Args:
+        page: PyMuPDF page object
+
+    Returns:
+        Page text with one line per visual text row and no blank lines
+    """
+    chars = []
+    for block in page.get_text("rawdict")["blocks"]:
+        for line in block.get("lines", ()):
+            for span in line["spans"]:
+                top = span["origin"][1] - (1 + span["descender"]) * span["size"]
+                chars.extend((top, char["bbox"][0], char["bbox"][2], char["c"]) for char in span["chars"])
+    chars.sort(key=lambda char: char[0])
+
+    # Cluster characters into rows whose tops are within the tolerance
+    rows: List[List[Tuple[float, float, float, str]]] = []
+    last_top = None
+    for char in chars:
+        if rows and char[0] - last_top <= _Y_TOLERANCE:
+            rows[-1].append(char)
+        else:
+            rows.append([char])
+        last_top = char[0]
+
+    lines = []
+    for row in rows:
+        row.sort(key=lambda char: char[1])
+        words = []
+        word = ""
+        last_x1 = None
+        for _, x0, x1, c in row:
+            if c.isspace() or (word and x0 - last_x1 > _X_TOLERANCE):
+                if word:
+                    words.append(word)
+                word = ""
+            if not c.isspace():
+                word += c
+            last_x1 = x1
+        if word:
+            words.append(word)
+        if words:
+            lines.append(" ".join(words))
+
+    return "\n".join(lines)
+
+
+def _dump_json(obj: Any, indent: bool = False) -> bytes:
+    """
+    Serialize an object to UTF-8 encoded JSON.
+
+    Args:
+        obj: JSON-serializable object
+        indent: Indent nested values by 2 spaces, as json.dump(..., indent=2)
+
+    Returns:
+        Encoded JSON document
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode('utf-8')
+
+
+def _load_json(data: bytes) -> Any:
+    """
+    Deserialize a UTF-8 encoded JSON document.
+
+    Args:
+        data: Encoded JSON document
+
+    Returns:
+        Decoded object
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _new_table(fields: Tuple[str, ...]) -> Dict[str, List[Any]]:
+    """
+    Create an empty struct-of-arrays table with a page column.
+
+    Args:
+        fields: Item fields, each stored as its own column
+
+    Returns:
+        Dict of parallel column lists
+    """
+    return {field: [] for field in ("page",) + fields}
+
+
+def _append_rows(table: Dict[str, List[Any]], page_num: int, rows: List[Dict[str, Any]]):
+    """
+    Append a page's items to a struct-of-arrays table.
+
+    Args:
+        table: Table created by _new_table
+        page_num: Page number the items belong to (1-indexed)
+        rows: Requirement or comment objects
+    """
+    table["page"].extend([page_num] * len(rows))
+    for field, column in table.items():
+        if field != "page":
+            column.extend(row[field] for row in rows)
+
+
+def _merge_rows(table: Dict[str, List[Any]], pages: Dict[int, List[Dict[str, Any]]]):
+    """
+    Insert several pages' items into a page-ordered table in one pass,
+    keeping it in page order.
+
+    Args:
+        table: Table created by _new_table, sorted by page
+        pages: Items keyed by page number, for pages not yet in the table
+    """
+    merged = {field: [] for field in table}
+    start = 0
+    for page_num in sorted(pages):
+        end = bisect.bisect_right(table["page"], page_num, start)
+        for field, column in merged.items():
+            column.extend(table[field][start:end])
+        _append_rows(merged, page_num, pages[page_num])
+        start = end
+    for field, column in merged.items():
+        column.extend(table[field][start:])
+        table[field] = column
+
+
+def _table_rows(table: Dict[str, List[Any]], fields: Tuple[str, ...], indices: Iterable[int]) -> List[Dict[str, Any]]:
+    """
+    Gather rows of a struct-of-arrays table back into item dicts.
+
+    Args:
+        table: Table created by _new_table
+        fields: Fields to include, in output order
+        indices: Row indices to gather
+
+    Returns:
+        List of item dicts
+    """
+    columns = [(field, table[field]) for field in fields]
+    return [{field: column[i] for field, column in columns} for i in indices]
+
+
+def _matching_rows(table: Dict[str, List[Any]], field: str, value: Optional[Any]) -> Iterable[int]:
+    """
+    Find the rows of a struct-of-arrays table whose field equals a value.
+
+    Args:
+        table: Table created by _new_table
+        field: Column to compare
+        value: Value to match, or None to select every row
+
+    Returns:
+        Matching row indices, in page order
+    """
+    column = table[field]
+    return range(len(column)) if value is None else [i for i, v in enumerate(column) if v == value]
+
+
+class _PageView(Mapping):
+    """
+    Read-only {"page_N": [...]} mapping over a page-ordered table, used when
+    saving output. A page's item dicts are gathered from the columns each
+    time it is looked up, so the full per-page layout is never held in memory.
+    """
+
+    def __init__(self, table: Dict[str, List[Any]], fields: Tuple[str, ...], n_pages: int):
+        """
+        Args:
+            table: Table created by _new_table, sorted by page
+            fields: Item fields, in output order
+            n_pages: Number of pages, including pages without items
+        """
+        self._table = table
+        self._fields = fields
+        self._n_pages = n_pages
+
+    def __getitem__(self, key: str) -> List[Dict[str, Any]]:
+        try:
+            page_num = int(key.partition("_")[2])
+        except (AttributeError, ValueError):
+            raise KeyError(key) from None
+        # Only the exact keys produced by __iter__, e.g. not "page_01"
+        if key != f"page_{page_num}" or not 1 <= page_num <= self._n_pages:
+            raise KeyError(key)
+
+        pages = self._table["page"]
+        rows = range(bisect.bisect_left(pages, page_num), bisect.bisect_right(pages, page_num))
+        return _table_rows(self._table, self._fields, rows)
+
+    def __iter__(self) -> Iterator[str]:
+        return (f"page_{page_num}" for page_num in range(1, self._n_pages + 1))
+
+    def __len__(self) -> int:
+        return self._n_pages
+
+
+class _JSONObjectWriter:
+    """
+    Writes a JSON object to disk one key at a time, producing the same
+    layout as _dump_json(..., indent=True) without holding the object in memory.
+    Entries go to a temporary file next to the target, which only replaces
+    the target once the object is complete.
+    """
+
+    def __init__(self, path: Path):
+        """
+        Open the temporary output file and start the object.
+
+        Args:
+            path: Path of the JSON file to write
+        """
+        self._path = path
+        self._temp_path = path.with_name(path.name + '.tmp')
+        self._file = open(self._temp_path, 'wb')
+        self._empty = True
+        self._file.write(b'{')
+
+    def write(self, key: str, value: Any):
+        """
+        Append a key/value pair to the object.
+
+        Args:
+            key: Object key
+            value: JSON-serializable value
+        """
+        # Serialize as a one-key object and drop the outer braces so nested
+        # values keep their indentation relative to the enclosing object
+        entry = _dump_json({key: value}, indent=True)[2:-2]
+        self._file.write((b'\n' if self._empty else b',\n') + entry)
+        self._empty = False
+
+    def close(self, complete: bool = True):
+        """
+        Finish the object and move it into place, or discard it.
+
+        Args:
+            complete: Whether every entry was written; if False the
+                temporary file is removed and the target is left untouched
+        """
+        if not complete:
+            self._file.close()
+            self._temp_path.unlink(missing_ok=True)
+            return
+
+        self._file.write(b'}' if self._empty else b'\n}')
+        self._file.close()
+        os.replace(self._temp_path, self._path)
+
 
 class PDFRequirementsParser:
     """
     Parser for extracting requirements and annotations from PDF documents.
     """
 
-    def __init__(self, pdf_path: str):
+    def __init__(
+        self,
+        pdf_path: str,
+        max_workers: Optional[int] = None,
+        verbose: bool = True,
+        ocr_dpi: int = 200
+    ):
         """
         Initialize the parser with a PDF file path.
 
         Args:
             pdf_path: Path to the PDF file to parse
+            max_workers: Number of worker processes used to parse pages
+                (defaults to the CPU count; 1 parses in-process)
+            verbose: Show a progress bar and print progress messages;
+                disable for quiet library use
+            ocr_dpi: Resolution scanned pages are rendered at for OCR
         """
         self.pdf_path = Path(pdf_path)
         if not self.pdf_path.exists():
             raise FileNotFoundError(f"PDF file not found: {pdf_path}")
 
-        self.requirements = {}
-        self.comments = {}
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.verbose = verbose
+        self.ocr_dpi = ocr_dpi
+
+        # Parsed pages are cached on disk keyed by the PDF's content hash
+        self.pdf_hash = self._hash_pdf()
+        self.cache_dir = Path.home() / '.cache' / 'pdf-req-parser' / self.pdf_hash
 
-    def parse(self) -> tuple[Dict[str, List[Dict[str, Any]]], Dict[str, List[Dict[str, Any]]]]:
+        # Parsed items stored column-wise (struct of arrays) in page order;
+        # the per-page requirements/comments dicts are built from these on demand
+        self.req_table = _new_table(_REQUIREMENT_FIELDS)
+        self.comment_table = _new_table(_COMMENT_FIELDS)
+        self._table_pages = 0
+        self._requirements_view = None
+        self._comments_view = None
+
+        # Directory the last parse streamed its output to, if any
+        self._streamed_to = None
+
+        # Page and item counts, kept even when output is streamed to disk
+        self.summary = {"pages": 0, "requirements": 0, "comments": 0, "scanned_pages": 0, "empty_pages": 0}
+
+        # Idle Tesseract APIs, created lazily on first OCR call and reused
+        self._tess_apis = None
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """
+        Drop the Tesseract APIs and parsed results when the parser is sent
+        to worker processes, which only need its configuration.
+        """
+        state = self.__dict__.copy()
+        for key in ('_tess_apis', 'req_table', 'comment_table', '_requirements_view', '_comments_view'):
+            state[key] = None
+        return state
+
+    @property
+    def requirements(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Requirements grouped by page ("page_N"), built from req_table."""
+        if self._requirements_view is None:
+            self._requirements_view = dict(_PageView(self.req_table, _REQUIREMENT_FIELDS, self._table_pages))
+        return self._requirements_view
+
+    @property
+    def comments(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Comments grouped by page ("page_N"), built from comment_table."""
+        if self._comments_view is None:
+            self._comments_view = dict(_PageView(self.comment_table, _COMMENT_FIELDS, self._table_pages))
+        return self._comments_view
+
+    def _output_pages(
+        self,
+        view: Optional[Dict[str, List[Dict[str, Any]]]],
+        table: Dict[str, List[Any]],
+        fields: Tuple[str, ...]
+    ) -> Mapping[str, List[Dict[str, Any]]]:
+        """
+        Return the items to save: the requirements/comments dict if it has
+        been built (so changes made to it are kept), else a lazy view that
+        builds one page at a time.
+
+        Args:
+            view: Cached requirements/comments dict, or None if not built
+            table: Table the items are stored in
+            fields: Item fields, in output order
+
+        Returns:
+            Items keyed by "page_N"
+        """
+        return view if view is not None else _PageView(table, fields, self._table_pages)
+
+    def filter_requirements(self, req_type: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Return requirements across all pages, optionally of a single type.
+
+        Args:
+            req_type: Content type to keep (e.g. "heading"), or None for all
+
+        Returns:
+            Requirement objects with their page number added
+        """
+        indices = _matching_rows(self.req_table, "type", req_type)
+        return _table_rows(self.req_table, ("page",) + _REQUIREMENT_FIELDS, indices)
+
+    def filter_comments(self, author: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Return comments across all pages, optionally by a single author.
+
+        Args:
+            author: Comment author to keep, or None for all
+
+        Returns:
+            Comment objects
+        """
+        indices = _matching_rows(self.comment_table, "author", author)
+        return _table_rows(self.comment_table, _COMMENT_FIELDS, indices)
+
+    def __del__(self):
+        """Release any Tesseract APIs held by the parser."""
+        tess_apis = getattr(self, '_tess_apis', None)
+        while tess_apis is not None and not tess_apis.empty():
+            tess_apis.get_nowait().End()
+
+    def _hash_pdf(self) -> str:
+        """
+        Compute the MD5 digest of the PDF, reading it in 1MB chunks.
+
+        Returns:
+            Hex digest of the file contents
+        """
+        digest = hashlib.md5(usedforsecurity=False)
+        with open(self.pdf_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def parse(
+        self,
+        force_refresh: bool = False,
+        stream_output_dir: Optional[str] = None
+    ) -> tuple[Dict[str, List[Dict[str, Any]]], Dict[str, List[Dict[str, Any]]]]:
         """
         Parse the PDF and extract requirements and comments.
 
+        Args:
+            force_refresh: Ignore cached pages from earlier runs and parse
+                every page again
+            stream_output_dir: If set, write requirements.json and
+                comments.json to this directory page by page while parsing
+                instead of collecting them in memory; only self.summary is
+                kept, so the filter methods have nothing to work with and
+                save_to_json/save_to_markdown raise RuntimeError. Pages are written in
+                page order, so scanned pages are OCR'd one at a time as
+                they come up rather than in one batch
+
         Returns:
             Tuple of (requirements_dict, comments_dict)
         """
-        print(f"Processing PDF: {self.pdf_path}")
+        if self.verbose:
+            print(f"Processing PDF: {self.pdf_path}")
+
+        with pymupdf.open(str(self.pdf_path)) as doc:
+            n_pages = doc.page_count
+
+        self.summary = {"pages": n_pages, "requirements": 0, "comments": 0, "scanned_pages": 0, "empty_pages": 0}
+
+        self.req_table = _new_table(_REQUIREMENT_FIELDS)
+        self.comment_table = _new_table(_COMMENT_FIELDS)
+        self._table_pages = n_pages if stream_output_dir is None else 0
+        self._requirements_view = self._comments_view = None
+        self._streamed_to = stream_output_dir
+
+        # Comments of scanned pages, kept until their requirements are OCR'd
+        scanned_comments = {}
+
+        requirements_writer = comments_writer = None
+        completed = False
+        try:
+            if stream_output_dir is not None:
+                output_path = Path(stream_output_dir)
+                output_path.mkdir(parents=True, exist_ok=True)
+                requirements_writer = _JSONObjectWriter(output_path / "requirements.json")
+                comments_writer = _JSONObjectWriter(output_path / "comments.json")
+
+            pages = tqdm(
+                self._iter_pages(n_pages, force_refresh),
+                total=n_pages,
+                desc='Pages',
+                unit='page',
+                disable=not self.verbose
+            )
+            for page_num, requirements, comments, ocr in pages:
+                self._store_page_items(self.comment_table, comments_writer, page_num, comments)
+                self.summary["comments"] += len(comments)
+                if ocr:
+                    # Scanned page OCR'd by an earlier run
+                    self.summary["scanned_pages"] += 1
+
+                if requirements is None:
+                    if requirements_writer is None:
+                        # Scanned page - filled in after the OCR batch below
+                        scanned_comments[page_num] = comments
+                        continue
+
+                    # Streamed entries are written as they come, so OCR the
+                    # page right away to keep the output in page order
+                    requirements = self._ocr_scanned_pages({page_num: comments})[page_num]
+
+                self._store_page_items(self.req_table, requirements_writer, page_num, requirements)
+                self.summary["requirements"] += len(requirements)
+
+            # Scanned pages come back without requirements; OCR them in one batch
+            if scanned_comments:
+                scanned_requirements = self._ocr_scanned_pages(scanned_comments)
+                # Merge in one pass so the table stays in page order
+                _merge_rows(self.req_table, scanned_requirements)
+                self.summary["requirements"] += sum(len(requirements) for requirements in scanned_requirements.values())
+
+            completed = True
+
+        finally:
+            # Only replace existing output files once parsing succeeded
+            for writer in (requirements_writer, comments_writer):
+                if writer is not None:
+                    writer.close(completed)
+
+        if self.verbose:
+            self.print_summary()
+
+        return self.requirements, self.comments
+
+    def _ocr_scanned_pages(self, scanned_comments: Dict[int, List[Dict[str, Any]]]) -> Dict[int, List[Dict[str, Any]]]:
+        """
+        OCR scanned pages in one batch, count them in the summary and cache
+        the pages OCR found content on.
+
+        Args:
+            scanned_comments: Annotation and inline comment objects of each
+                scanned page, keyed by page number (ascending)
+
+        Returns:
+            Requirement objects keyed by page number
+        """
+        scanned_requirements = self._extract_scanned_requirements(list(scanned_comments))
+        self.summary["scanned_pages"] += len(scanned_requirements)
+
+        for page_num, requirements in scanned_requirements.items():
+            if requirements:
+                self._save_cached_page(page_num, requirements, scanned_comments[page_num], ocr=True)
+            else:
+                # Don't cache scanned pages OCR found nothing on, so a later run retries them
+                self.summary["empty_pages"] += 1
+
+        return scanned_requirements
+
+    def _store_page_items(
+        self,
+        table: Dict[str, List[Any]],
+        writer: Optional[_JSONObjectWriter],
+        page_num: int,
+        items: List[Dict[str, Any]]
+    ):
+        """
+        Keep a page's items in memory, or stream them to disk when writing
+        output incrementally.
+
+        Args:
+            table: In-memory table the items belong to
+            writer: Streaming JSON writer, or None to keep items in memory
+            page_num: Page number (1-indexed)
+            items: Requirement or comment objects for the page
+        """
+        if writer is not None:
+            writer.write(f"page_{page_num}", items)
+        else:
+            _append_rows(table, page_num, items)
+
+    def _iter_pages(
+        self,
+        n_pages: int,
+        force_refresh: bool
+    ) -> Iterator[Tuple[int, Optional[List[Dict[str, Any]]], List[Dict[str, Any]], bool]]:
+        """
+        Yield every page's results in page order, loading pages from the disk
+        cache where possible and parsing the rest in worker processes.
+
+        Args:
+            n_pages: Number of pages in the PDF
+            force_refresh: Ignore cached pages from earlier runs
+
+        Yields:
+            Tuple of (page_num, requirements, comments, ocr); requirements is
+            None for scanned pages that still need OCR, and ocr is True for
+            cached pages whose requirements came from OCR
+        """
+        page_numbers = range(1, n_pages + 1)
+        pending_pages = [
+            page_num for page_num in page_numbers
+            if force_refresh or not self._cache_file(page_num).exists()
+        ]
+        pending = set(pending_pages)
+        results = self._process_pages(pending_pages)
+
+        try:
+            for page_num in page_numbers:
+                if page_num in pending:
+                    result = next(results)
+                else:
+                    # Reuse the page parsed by an earlier run on the same PDF
+                    cached = self._load_cached_page(page_num)
+                    if cached is not None:
+                        yield page_num, *cached
+                        continue
+
+                    # Unreadable or stale cache entry - parse the page here instead
+                    result = self._process_page(page_num)
+
+                _, requirements, annotations, inline_comments = result
+                comments = annotations + inline_comments
+                if requirements is not None:
+                    self._save_cached_page(page_num, requirements, comments)
+
+                yield page_num, requirements, comments, False
+
+        finally:
+            results.close()
+            _close_worker_document(self.pdf_path)
+
+    def _process_pages(
+        self,
+        page_nums: List[int]
+    ) -> Iterator[Tuple[int, Optional[List[Dict[str, Any]]], List[Dict[str, Any]], List[Dict[str, Any]]]]:
+        """
+        Run _process_page over pages, in parallel worker processes when
+        there is more than one page to parse.
+
+        Args:
+            page_nums: Page numbers to process (1-indexed, ascending)
+
+        Yields:
+            _process_page results, in the order of page_nums
+        """
+        # Pages are independent, so parse them in parallel worker processes
+        max_workers = min(self.max_workers, len(page_nums))
+
+        if max_workers <= 1:
+            for page_num in page_nums:
+                yield self._process_page(page_num)
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                yield from executor.map(self._process_page, page_nums, chunksize=4)
+
+    def _cache_file(self, page_num: int) -> Path:
+        """Return the disk cache file for a page."""
+        return self.cache_dir / f"page_{page_num}.json"
+
+    def _ocr_settings(self) -> Dict[str, Any]:
+        """Return the OCR settings recorded with cached OCR'd pages."""
+        return {"dpi": self.ocr_dpi, "lang": _OCR_LANG, "psm": _OCR_PSM, "oem": _OCR_OEM}
+
+    def _load_cached_page(self, page_num: int) -> Optional[Tuple[List[Dict[str, Any]], List[Dict[str, Any]], bool]]:
+        """
+        Load a page parsed by an earlier run from the disk cache.
+
+        Args:
+            page_num: Page number (1-indexed)
+
+        Returns:
+            Tuple of (requirements, comments, ocr), where ocr tells whether
+            the requirements came from OCR, or None on a cache miss or if the
+            page was OCR'd with different settings
+        """
+        try:
+            with open(self._cache_file(page_num), 'rb') as f:
+                cached = _load_json(f.read())
+        except (OSError, ValueError):
+            return None
+
+        if not isinstance(cached, dict) or cached.get("version") != _CACHE_VERSION:
+            return None
+        if cached["ocr"] is not None and cached["ocr"] != self._ocr_settings():
+            return None
+        return cached["requirements"], cached["comments"], cached["ocr"] is not None
+
+    def _save_cached_page(
+        self,
+        page_num: int,
+        requirements: List[Dict[str, Any]],
+        comments: List[Dict[str, Any]],
+        ocr: bool = False
+    ):
+        """
+        Store a parsed page in the disk cache.
+
+        Args:
+            page_num: Page number (1-indexed)
+            requirements: Requirement objects for the page
+            comments: Annotation and inline comment objects for the page
+            ocr: Whether the requirements came from OCR; the OCR settings are
+                stored with the entry so a run with other settings redoes it
+        """
+        entry = {
+            "version": _CACHE_VERSION,
+            "ocr": self._ocr_settings() if ocr else None,
+            "requirements": requirements,
+            "comments": comments
+        }
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(self._cache_file(page_num), 'wb') as f:
+                f.write(_dump_json(entry))
+        except OSError as e:
+            # Don't raise - the cache only speeds up later runs
+            print(f"Warning: Could not cache page {page_num}: {e}", file=sys.stderr)
+
+    def _process_page(self, page_num: int) -> Tuple[int, Optional[List[Dict[str, Any]]], List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Extract requirements, annotations and inline comments from one page.
+        Runs inside a worker process when parsing in parallel.
+
+        Args:
+            page_num: Page number to process (1-indexed)
+
+        Returns:
+            Tuple of (page_num, requirements, annotations, inline_comments);
+            requirements is None for scanned pages that still need OCR
+        """
+        doc = _get_worker_document(self.pdf_path)
+        page = doc[page_num - 1]
+        text = self._extract_page_text(page, page_num)
 
         # Extract requirements (main text content)
-        self._extract_requirements()
+        requirements = self._extract_requirements(text, page_num)
 
         # Extract annotations (PDF comments)
-        self._extract_annotations()
+        annotations = self._extract_annotations(page, page_num)
 
         # Extract inline comments (Word-style comments in text)
-        self._extract_inline_comments()
+        inline_comments = self._extract_inline_comments(text, page_num)
 
-        return self.requirements, self.comments
+        return page_num, requirements, annotations, inline_comments
+
+    def _extract_page_text(self, page: pymupdf.Page, page_num: int) -> str:
+        """
+        Extract the raw text layer of a page.
+
+        Args:
+            page: PyMuPDF page object
+            page_num: Page number (1-indexed)
 
-    def _extract_requirements(self):
+        Returns:
+            Page text, empty if the page has no text layer
         """
-        Extract main text content (requirements) from the PDF.
-        Handles both text-based and scanned PDFs.
+        # PyMuPDF returns page text directly without building pdfminer's
+        # layout object graph
+        text = _layout_page_text(page)
+
+        # Fall back to pdfplumber only when PyMuPDF found no text. The text is
+        # only split into lines later, so use the simple extractor, which
+        # groups characters into lines without layout-aware clustering
+        if not text.strip():
+            plumber_page = _get_worker_plumber_document(self.pdf_path).pages[page_num - 1]
+            text = plumber_page.extract_text_simple(x_tolerance=_X_TOLERANCE, y_tolerance=_Y_TOLERANCE) or ""
+            # The handle outlives the page, so drop its parsed characters
+            plumber_page.close()
+
+        return text
+
+    def _extract_requirements(self, text: str, page_num: int) -> Optional[List[Dict[str, Any]]]:
+        """
+        Extract main text content (requirements) from a text-based page.
+
+        Args:
+            text: Raw page text
+            page_num: Page number (1-indexed)
+
+        Returns:
+            List of requirement objects, or None if the page has no text
+            layer and must go through OCR
         """
         try:
-            # First, try extracting with pdfplumber for better structure
-            with pdfplumber.open(self.pdf_path) as pdf:
-                for page_num, page in enumerate(pdf.pages, start=1):
-                    page_key = f"page_{page_num}"
-
-                    # Extract text from the page
-                    text = page.extract_text()
-
-                    if text and text.strip():
-                        # Text-based page - parse the content
-                        requirements = self._parse_text_content(text)
-                        self.requirements[page_key] = requirements
-                        print(f"✓ Extracted text from page {page_num}")
-                    else:
-                        # Possibly a scanned page - try OCR
-                        if OCR_AVAILABLE:
-                            ocr_text = self._perform_ocr(page_num)
-                            if ocr_text:
-                                requirements = self._parse_text_content(ocr_text)
-                                self.requirements[page_key] = requirements
-                                print(f"✓ OCR processed page {page_num}")
-                            else:
-                                self.requirements[page_key] = []
-                                print(f"⚠ No content found on page {page_num}")
-                        else:
-                            self.requirements[page_key] = []
-                            print(f"⚠ Scanned page {page_num} - OCR not available")
+            if not text.strip():
+                # Possibly a scanned page - OCR'd later together with the others
+                return None
+
+            # Text-based page - parse the content
+            return self._parse_text_content(text)
 
         except Exception as e:
             print(f"Error extracting requirements: {e}", file=sys.stderr)
             raise
 
+    def _extract_scanned_requirements(self, page_nums: List[int]) -> Dict[int, List[Dict[str, Any]]]:
+        """
+        Extract requirements from scanned pages using a single OCR batch.
+
+        Args:
+            page_nums: Scanned page numbers (1-indexed, ascending)
+
+        Returns:
+            Requirement objects keyed by page number
+        """
+        ocr_texts = self._perform_ocr(page_nums) if OCR_AVAILABLE else {}
+
+        requirements = {}
+        for page_num in page_nums:
+            ocr_text = ocr_texts.get(page_num)
+            requirements[page_num] = self._parse_text_content(ocr_text) if ocr_text else []
+
+        return requirements
+
     def _parse_text_content(self, text: str) -> List[Dict[str, Any]]:
         """
         Parse text content into structured requirements.
@@ -117,8 +950,6 @@ class PDFRequirementsParser:
         Returns:
             List of requirement objects
         """
-        requirements = []
-
         # Remove inline comments before processing requirements
         cleaned_text = self._remove_inline_comments(text)
 
@@ -126,20 +957,17 @@ class PDFRequirementsParser:
         # Try multiple splitting strategies
         sections = self._split_into_sections(cleaned_text)
 
-        for idx, section in enumerate(sections, start=1):
-            if not section.strip():
-                continue
-
-            # Determine if this is a heading or regular text
-            req_type = self._classify_content(section)
-
-            requirement = {
+        # Classify each non-empty section as a heading, list item, paragraph, ...
+        requirements = [
+            {
                 "id": idx,
-                "type": req_type,
+                "type": self._classify_content(section),
                 "text": section.strip(),
-                "line_count": len(section.split('\n'))
+                "line_count": section.count('\n') + 1
             }
-            requirements.append(requirement)
+            for idx, section in enumerate(sections, start=1)
+            if section.strip()
+        ]
 
         return requirements
 
@@ -153,20 +981,16 @@ class PDFRequirementsParser:
         Returns:
             List of text sections
         """
-        import re
-
         # Strategy 1: Split by double newlines
         sections = [s.strip() for s in text.split('\n\n') if s.strip()]
 
         # Strategy 2: If we have very few sections, try splitting by bullet points
         if len(sections) <= 2:
-            bullet_pattern = r'(?=^•\s)'
-            sections = [s.strip() for s in re.split(bullet_pattern, text, flags=re.MULTILINE) if s.strip()]
+            sections = [s.strip() for s in _RE_BULLET.split(text) if s.strip()]
 
         # Strategy 3: If still too few, split by major headings
         if len(sections) <= 2:
-            heading_pattern = r'(?=^[A-Z][^\n]{0,80}$)'
-            sections = [s.strip() for s in re.split(heading_pattern, text, flags=re.MULTILINE) if s.strip()]
+            sections = [s.strip() for s in _RE_HEADING.split(text) if s.strip()]
 
         return sections if sections else [text]
 
@@ -180,14 +1004,13 @@ class PDFRequirementsParser:
         Returns:
             Text with comments removed
         """
-        import re
-        # Pattern for Word comments: Commented [xxx]: comment text (until end of line or next comment)
-        # Remove the entire comment including the tag and text
-        cleaned = re.sub(r'Commented \[[^\]]+\]:[^\n]+', '', text, flags=re.MULTILINE)
-        # Remove any inline comment tags without the colon (edge cases)
-        cleaned = re.sub(r'Commented \[[^\]]+\]', '', cleaned)
+        # Pattern for Word comments: Commented [xxx]: comment text (until end of line)
+        # Remove the entire comment including the tag and text in a single pass;
+        # the optional ':...' suffix also covers bare tags without a colon.
+        # Most pages have no comments, so check for the marker before scanning
+        cleaned = _RE_COMMENT_ANY.sub('', text) if _COMMENT_MARKER in text else text
         # Clean up multiple consecutive blank lines
-        cleaned = re.sub(r'\n{3,}', '\n\n', cleaned)
+        cleaned = _RE_BLANKS.sub('\n\n', cleaned)
         return cleaned.strip()
 
     def _classify_content(self, text: str) -> str:
@@ -200,24 +1023,31 @@ class PDFRequirementsParser:
         Returns:
             Content type as string
         """
-        lines = [l for l in text.split('\n') if l.strip()]
-        if not lines:
+        if not text:
             return "paragraph"
 
-        first_line = lines[0].strip()
+        # Find the first non-blank line without splitting the whole section
+        start = 0
+        while True:
+            nl = text.find('\n', start)
+            first_line = (text[start:] if nl < 0 else text[start:nl]).strip()
+            if first_line or nl < 0:
+                break
+            start = nl + 1
+
+        if not first_line:
+            return "paragraph"
 
         # Check if it's a heading (short, uppercase, or ends with colon)
-        if len(first_line) < 100 and (first_line.isupper() or first_line.endswith(':')):
+        if len(first_line) < 100 and (first_line.endswith(':') or first_line.isupper()):
             return "heading"
 
         # Check if it's a field list (like "Field Name Description Data Type")
-        if any(keyword in first_line for keyword in ['Field Name', 'Field List', 'Description', 'Data Type']):
+        if _RE_FIELD.search(first_line):
             return "field_list"
 
-        # Check if it's a list item
-        if first_line.startswith(('•', '-', '*', '◦', '▪')) or (
-            len(first_line) > 0 and first_line[0].isdigit() and '.' in first_line[:5]
-        ):
+        # Check if it's a list item (bullet, or a number with a dot in the first 5 chars)
+        if _RE_LIST_START.match(first_line):
             return "list_item"
 
         # Check if it's a table-like structure
@@ -226,72 +1056,107 @@ class PDFRequirementsParser:
 
         return "paragraph"
 
-    def _perform_ocr(self, page_num: int) -> str:
+    def _perform_ocr(self, page_nums: List[int]) -> Dict[int, str]:
         """
-        Perform OCR on a scanned page.
+        Perform OCR on scanned pages.
 
         Args:
-            page_num: Page number to process (1-indexed)
+            page_nums: Page numbers to process (1-indexed, ascending)
 
         Returns:
-            Extracted text from OCR
+            Extracted text from OCR keyed by page number
         """
-        if not OCR_AVAILABLE:
-            return ""
+        if not OCR_AVAILABLE or not page_nums:
+            return {}
+
+        if self._tess_apis is None:
+            self._tess_apis = queue.SimpleQueue()
+
+        workers = min(self.max_workers, len(page_nums))
+        # Rendered pages waiting for OCR; bounds how many images are in memory
+        window = 2 * workers
+        futures = {}
+        ocr_texts = {}
 
         try:
-            # Convert PDF page to image
-            from pdf2image import convert_from_path
-            images = convert_from_path(
-                self.pdf_path,
-                first_page=page_num,
-                last_page=page_num,
-                dpi=300  # High resolution for better OCR
-            )
+            # Render only the scanned pages, straight from the open document.
+            # MuPDF documents aren't thread-safe, so rendering stays on this
+            # thread while Tesseract (which releases the GIL) OCRs earlier pages
+            with pymupdf.open(str(self.pdf_path)) as doc, ThreadPoolExecutor(max_workers=workers) as executor:
+                for index, page_num in enumerate(page_nums):
+                    earlier = futures.get(page_nums[index - window]) if index >= window else None
+                    if earlier is not None:
+                        wait([earlier])
+
+                    # A page that fails to render or OCR is skipped, not the batch
+                    try:
+                        # Tesseract works on grayscale anyway
+                        pixmap = doc[page_num - 1].get_pixmap(dpi=self.ocr_dpi, colorspace=pymupdf.csGRAY)
+                        image = Image.frombytes('L', (pixmap.width, pixmap.height), pixmap.samples)
+                    except Exception as e:
+                        print(f"OCR error on page {page_num}: {e}", file=sys.stderr)
+                        continue
+                    futures[page_num] = executor.submit(self._ocr_image, image)
 
-            if images:
-                # Perform OCR on the image
-                text = pytesseract.image_to_string(images[0], lang='eng')
-                return text.strip()
+                for page_num, future in futures.items():
+                    try:
+                        ocr_texts[page_num] = future.result()
+                    except Exception as e:
+                        print(f"OCR error on page {page_num}: {e}", file=sys.stderr)
 
-        except ImportError:
-            print("⚠ pdf2image not available. Install with: uv add pdf2image", file=sys.stderr)
         except Exception as e:
-            print(f"OCR error on page {page_num}: {e}", file=sys.stderr)
+            print(f"OCR error on pages {page_nums}: {e}", file=sys.stderr)
 
-        return ""
+        return ocr_texts
 
-    def _extract_annotations(self):
+    def _ocr_image(self, image: "Image.Image") -> str:
         """
-        Extract all annotations (comments, highlights, notes) from the PDF.
+        Run OCR on a rendered page image using a resident Tesseract API.
+
+        Args:
+            image: Grayscale page image
+
+        Returns:
+            Extracted text from OCR
         """
+        # Each API is used by one thread at a time and returned for reuse
         try:
-            with open(self.pdf_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
+            tess_api = self._tess_apis.get_nowait()
+        except queue.Empty:
+            tess_api = PyTessBaseAPI(lang=_OCR_LANG, psm=getattr(PSM, _OCR_PSM), oem=getattr(OEM, _OCR_OEM))
 
-                for page_num in range(len(pdf_reader.pages)):
-                    page_key = f"page_{page_num + 1}"
-                    page = pdf_reader.pages[page_num]
+        try:
+            # Stretch contrast so faint scans survive the lower resolution
+            tess_api.SetImage(ImageOps.autocontrast(image))
+            return tess_api.GetUTF8Text().strip()
+        finally:
+            self._tess_apis.put(tess_api)
 
-                    # Extract annotations from the page
-                    annotations = self._get_page_annotations(page, page_num + 1)
+    def _extract_annotations(self, page: pymupdf.Page, page_num: int) -> List[Dict[str, Any]]:
+        """
+        Extract all annotations (comments, highlights, notes) from a page.
+
+        Args:
+            page: PyMuPDF page object
+            page_num: Page number (1-indexed)
 
-                    if annotations:
-                        self.comments[page_key] = annotations
-                        print(f"✓ Extracted {len(annotations)} annotation(s) from page {page_num + 1}")
-                    else:
-                        self.comments[page_key] = []
+        Returns:
+            List of annotation objects
+        """
+        try:
+            return self._get_page_annotations(page, page_num)
 
         except Exception as e:
             print(f"Error extracting annotations: {e}", file=sys.stderr)
             # Don't raise - annotations are optional
+            return []
 
-    def _get_page_annotations(self, page: PyPDF2.PageObject, page_num: int) -> List[Dict[str, Any]]:
+    def _get_page_annotations(self, page: pymupdf.Page, page_num: int) -> List[Dict[str, Any]]:
         """
         Extract annotations from a specific page.
 
         Args:
-            page: PyPDF2 page object
+            page: PyMuPDF page object
             page_num: Page number (1-indexed)
 
         Returns:
@@ -300,165 +1165,116 @@ class PDFRequirementsParser:
         annotations = []
 
         try:
-            # Access the annotations array
-            if '/Annots' in page:
-                annots = page['/Annots']
-
-                # Resolve indirect references
-                if hasattr(annots, 'get_object'):
-                    annots = annots.get_object()
-
-                for idx, annot_ref in enumerate(annots, start=1):
-                    try:
-                        # Resolve the annotation object
-                        annot = annot_ref.get_object() if hasattr(annot_ref, 'get_object') else annot_ref
-
-                        # Extract annotation details
-                        annotation = {
-                            "id": idx,
-                            "page": page_num,
-                            "type": self._get_annotation_type(annot),
-                            "author": self._get_annotation_author(annot),
-                            "text": self._get_annotation_text(annot),
-                            "subject": self._get_annotation_subject(annot),
-                            "color": self._get_annotation_color(annot)
-                        }
-
-                        # Only include if there's actual content
-                        if annotation["text"] or annotation["subject"]:
-                            annotations.append(annotation)
-
-                    except Exception as e:
-                        print(f"Warning: Could not parse annotation {idx} on page {page_num}: {e}", file=sys.stderr)
-                        continue
+            for idx, annot in enumerate(page.annots(), start=1):
+                try:
+                    # Extract annotation details
+                    annotation = {
+                        "id": idx,
+                        "page": page_num,
+                        "type": self._get_annotation_type(annot),
+                        "author": self._get_annotation_author(annot),
+                        "text": self._get_annotation_text(annot),
+                        "subject": self._get_annotation_subject(annot),
+                        "color": self._get_annotation_color(annot)
+                    }
+
+                    # Only include if there's actual content
+                    if annotation["text"] or annotation["subject"]:
+                        annotations.append(annotation)
+
+                except Exception as e:
+                    print(f"Warning: Could not parse annotation {idx} on page {page_num}: {e}", file=sys.stderr)
+                    continue
 
         except Exception as e:
             print(f"Warning: Could not access annotations on page {page_num}: {e}", file=sys.stderr)
 
         return annotations
 
-    def _get_annotation_type(self, annot: Dict) -> str:
-        """Extract annotation type."""
-        if '/Subtype' in annot:
-            subtype = str(annot['/Subtype'])
-            return subtype.replace('/', '')
+    def _get_annotation_type(self, annot: pymupdf.Annot) -> str:
+        """Extract annotation type (/Subtype)."""
+        if annot.type:
+            return annot.type[1]
         return "Unknown"
 
-    def _get_annotation_author(self, annot: Dict) -> str:
-        """Extract annotation author."""
-        if '/T' in annot:
-            return str(annot['/T'])
-        return "Unknown"
+    def _get_annotation_author(self, annot: pymupdf.Annot) -> str:
+        """Extract annotation author (/T)."""
+        return annot.info.get("title") or "Unknown"
+
+    def _get_annotation_text(self, annot: pymupdf.Annot) -> str:
+        """Extract annotation content text (/Contents)."""
+        return annot.info.get("content") or ""
+
+    def _get_annotation_subject(self, annot: pymupdf.Annot) -> str:
+        """Extract annotation subject (/Subj)."""
+        return annot.info.get("subject") or ""
+
+    def _get_annotation_color(self, annot: pymupdf.Annot) -> Optional[str]:
+        """Extract annotation color (/C)."""
+        try:
+            # RGB color; missing, gray or CMYK colors fail to unpack
+            r, g, b = annot.colors.get("stroke")
+            return '#%02x%02x%02x' % (int(r * 255), int(g * 255), int(b * 255))
+        except (TypeError, ValueError):
+            return None
 
-    def _get_annotation_text(self, annot: Dict) -> str:
-        """Extract annotation content text."""
-        if '/Contents' in annot:
-            return str(annot['/Contents'])
-        return ""
-
-    def _get_annotation_subject(self, annot: Dict) -> str:
-        """Extract annotation subject."""
-        if '/Subj' in annot:
-            return str(annot['/Subj'])
-        return ""
-
-    def _get_annotation_color(self, annot: Dict) -> str:
-        """Extract annotation color."""
-        if '/C' in annot:
-            try:
-                color = annot['/C']
-                if isinstance(color, list) and len(color) == 3:
-                    # RGB color
-                    r, g, b = [int(c * 255) for c in color]
-                    return f"#{r:02x}{g:02x}{b:02x}"
-            except:
-                pass
-        return None
-
-    def _extract_inline_comments(self):
+    def _extract_inline_comments(self, text: str, page_num: int) -> List[Dict[str, Any]]:
         """
         Extract inline Word-style comments from the text content.
         These are comments embedded in the text like "Commented [AK1]: comment text"
-        """
-        import re
 
-        try:
-            with pdfplumber.open(self.pdf_path) as pdf:
-                for page_num, page in enumerate(pdf.pages, start=1):
-                    page_key = f"page_{page_num}"
+        Args:
+            text: Raw page text
+            page_num: Page number (1-indexed)
 
-                    # Get the raw text
-                    text = page.extract_text()
-                    if not text:
-                        continue
+        Returns:
+            List of inline comment objects
+        """
+        # Skip pages without extractable text or without any comment marker;
+        # the substring check is far cheaper than running the block regex
+        if not text or _COMMENT_MARKER not in text:
+            return []
 
-                    # More precise pattern: capture only until the next line that starts with a requirement marker
-                    # or another comment
-                    lines = text.split('\n')
-                    inline_comments = []
-
-                    i = 0
-                    while i < len(lines):
-                        line = lines[i]
-
-                        # Check if this line contains a comment start
-                        comment_match = re.match(r'Commented \[([^\]]+)\]:\s*(.*)', line)
-
-                        if comment_match:
-                            author_tag = comment_match.group(1)
-                            comment_text = comment_match.group(2).strip()
-
-                            # Look ahead to capture multi-line comments
-                            # but stop at requirement markers (bullets, field names, or next comment)
-                            j = i + 1
-                            while j < len(lines):
-                                next_line = lines[j].strip()
-
-                                # Stop conditions: next comment, bullet point, field name, or empty line followed by structure
-                                if (next_line.startswith('Commented [') or
-                                    next_line.startswith(('•', 'o ', '▪', 'Field Name', 'Name ', 'Is Active')) or
-                                    (not next_line and j + 1 < len(lines) and lines[j+1].strip().startswith(('•', 'Field')))):
-                                    break
-
-                                # Add this line to comment if it's not empty and doesn't look like a requirement
-                                if next_line and not next_line.startswith(('User Story', 'Campaign Details')):
-                                    comment_text += ' ' + next_line
-                                    j += 1
-                                else:
-                                    break
-
-                            # Clean up the comment text
-                            comment_text = ' '.join(comment_text.split())
-
-                            # Skip if comment is too short or looks malformed
-                            if len(comment_text) >= 10:
-                                comment = {
-                                    "id": len(inline_comments) + 1,
-                                    "page": page_num,
-                                    "type": "InlineComment",
-                                    "author": author_tag,
-                                    "text": comment_text,
-                                    "subject": "Word Comment",
-                                    "color": None
-                                }
-                                inline_comments.append(comment)
-
-                            i = j
-                        else:
-                            i += 1
-
-                    # Store comments
-                    if page_key not in self.comments:
-                        self.comments[page_key] = []
-
-                    if inline_comments:
-                        self.comments[page_key].extend(inline_comments)
-                        print(f"✓ Extracted {len(inline_comments)} inline comment(s) from page {page_num}")
+        try:
+            inline_comments = []
+
+            # One pass of the regex engine over the page instead of walking lines in Python
+            for comment_match in _RE_INLINE_BLOCK.finditer(text):
+                author_tag = comment_match.group(1)
+
+                # Join continuation lines and clean up the comment text
+                comment_text = ' '.join(comment_match.group(2).split())
+
+                # Skip if comment is too short or looks malformed
+                if len(comment_text) >= 10:
+                    comment = {
+                        "id": len(inline_comments) + 1,
+                        "page": page_num,
+                        "type": "InlineComment",
+                        "author": author_tag,
+                        "text": comment_text,
+                        "subject": "Word Comment",
+                        "color": None
+                    }
+                    inline_comments.append(comment)
+
+            return inline_comments
 
         except Exception as e:
             print(f"Error extracting inline comments: {e}", file=sys.stderr)
-            import traceback
             traceback.print_exc()
+            return []
+
+    def _check_results_in_memory(self):
+        """
+        Raise RuntimeError after a streamed parse, which kept no results in
+        memory, so saving can't overwrite the streamed files with empty ones.
+        """
+        if self._streamed_to is not None:
+            raise RuntimeError(
+                f"The last parse streamed its results to {self._streamed_to}; "
+                "parse again without stream_output_dir to save them"
+            )
 
     def save_to_json(self, output_dir: str):
         """
@@ -467,28 +1283,54 @@ class PDFRequirementsParser:
         Args:
             output_dir: Directory to save the output files
         """
+        self._check_results_in_memory()
         output_path = Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
 
         # Save requirements
         requirements_file = output_path / "requirements.json"
-        with open(requirements_file, 'w', encoding='utf-8') as f:
-            json.dump(self.requirements, f, indent=2, ensure_ascii=False)
-        print(f"\n✓ Requirements saved to: {requirements_file}")
+        self._write_pages(requirements_file, self._output_pages(self._requirements_view, self.req_table, _REQUIREMENT_FIELDS))
+        if self.verbose:
+            print(f"\n✓ Requirements saved to: {requirements_file}")
 
         # Save comments
         comments_file = output_path / "comments.json"
-        with open(comments_file, 'w', encoding='utf-8') as f:
-            json.dump(self.comments, f, indent=2, ensure_ascii=False)
-        print(f"✓ Comments saved to: {comments_file}")
+        self._write_pages(comments_file, self._output_pages(self._comments_view, self.comment_table, _COMMENT_FIELDS))
+        if self.verbose:
+            print(f"✓ Comments saved to: {comments_file}")
 
-        # Print summary
-        total_requirements = sum(len(reqs) for reqs in self.requirements.values())
-        total_comments = sum(len(cmts) for cmts in self.comments.values())
+    def _write_pages(self, path: Path, pages: Mapping[str, List[Dict[str, Any]]]):
+        """
+        Write a per-page view to a JSON file one page at a time.
+
+        Args:
+            path: Path of the JSON file to write
+            pages: Items keyed by "page_N"
+        """
+        writer = _JSONObjectWriter(path)
+        completed = False
+        try:
+            for page_key, items in pages.items():
+                writer.write(page_key, items)
+            completed = True
+        finally:
+            writer.close(completed)
+
+    def print_summary(self):
+        """
+        Print page, requirement and comment totals for the last parse.
+        """
         print(f"\n📊 Summary:")
-        print(f"   Total pages: {len(self.requirements)}")
-        print(f"   Total requirements: {total_requirements}")
-        print(f"   Total comments: {total_comments}")
+        print(f"   Total pages: {self.summary['pages']}")
+        print(f"   Total requirements: {self.summary['requirements']}")
+        print(f"   Total comments: {self.summary['comments']}")
+
+        if self.summary['scanned_pages']:
+            print(f"   Scanned pages: {self.summary['scanned_pages']}")
+            if not OCR_AVAILABLE:
+                print("   ⚠ OCR not available - scanned pages were not processed")
+            elif self.summary['empty_pages']:
+                print(f"   ⚠ No content found on {self.summary['empty_pages']} scanned page(s)")
 
     def save_to_markdown(self, output_dir: str):
         """
@@ -497,80 +1339,87 @@ class PDFRequirementsParser:
         Args:
             output_dir: Directory to save the output file
         """
+        self._check_results_in_memory()
         output_path = Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
 
         markdown_file = output_path / "parsed_document.md"
+        requirements = self._output_pages(self._requirements_view, self.req_table, _REQUIREMENT_FIELDS)
+        comments_by_page = self._output_pages(self._comments_view, self.comment_table, _COMMENT_FIELDS)
 
-        with open(markdown_file, 'w', encoding='utf-8') as f:
-            # Write header
-            f.write(f"# PDF Requirements Document\n\n")
-            f.write(f"**Source:** {self.pdf_path.name}\n\n")
-            f.write(f"**Total Pages:** {len(self.requirements)}\n\n")
-            f.write("---\n\n")
+        # Collect the document in memory and write it out in one go
+        parts: List[str] = []
+
+        # Write header
+        parts.append(f"# PDF Requirements Document\n\n")
+        parts.append(f"**Source:** {self.pdf_path.name}\n\n")
+        parts.append(f"**Total Pages:** {len(requirements)}\n\n")
+        parts.append("---\n\n")
 
-            # Write requirements by page
-            f.write("## Requirements\n\n")
+        # Write requirements by page
+        parts.append("## Requirements\n\n")
 
-            for page_key in sorted(self.requirements.keys(), key=lambda x: int(x.split('_')[1])):
+        for page_key in sorted(requirements.keys(), key=lambda x: int(x.split('_')[1])):
+            page_num = page_key.split('_')[1]
+            reqs = requirements[page_key]
+
+            if not reqs:
+                continue
+
+            parts.append(f"### Page {page_num}\n\n")
+
+            for req in reqs:
+                req_type = req['type'].replace('_', ' ').title()
+                parts.append(f"**[{req_type} {req['id']}]**\n\n")
+
+                # Format text based on type
+                text = req['text']
+
+                if req['type'] == 'list_item':
+                    # Ensure list items are properly formatted
+                    lines = (line.strip() for line in text.split('\n'))
+                    parts.extend(
+                        f"{line}\n" if line.startswith(('•', '-', '*', 'o ')) else f"- {line}\n"
+                        for line in lines if line
+                    )
+                elif req['type'] == 'heading':
+                    parts.append(f"**{text}**\n")
+                elif req['type'] == 'table' or req['type'] == 'field_list':
+                    # Keep table formatting as code block
+                    parts.append(f"```text\n{text}\n```\n")
+                else:
+                    # Regular paragraph
+                    parts.append(f"{text}\n")
+
+                parts.append("\n")
+
+            parts.append("---\n\n")
+
+        # Write comments by page
+        total_comments = sum(len(cmts) for cmts in comments_by_page.values())
+        if total_comments > 0:
+            parts.append("## Comments & Annotations\n\n")
+
+            for page_key in sorted(comments_by_page.keys(), key=lambda x: int(x.split('_')[1])):
                 page_num = page_key.split('_')[1]
-                reqs = self.requirements[page_key]
+                comments = comments_by_page[page_key]
 
-                if not reqs:
+                if not comments:
                     continue
 
-                f.write(f"### Page {page_num}\n\n")
-
-                for req in reqs:
-                    req_type = req['type'].replace('_', ' ').title()
-                    f.write(f"**[{req_type} {req['id']}]**\n\n")
-
-                    # Format text based on type
-                    text = req['text']
-
-                    if req['type'] == 'list_item':
-                        # Ensure list items are properly formatted
-                        lines = text.split('\n')
-                        for line in lines:
-                            if line.strip():
-                                if not line.strip().startswith(('•', '-', '*', 'o ')):
-                                    f.write(f"- {line.strip()}\n")
-                                else:
-                                    f.write(f"{line.strip()}\n")
-                    elif req['type'] == 'heading':
-                        f.write(f"**{text}**\n")
-                    elif req['type'] == 'table' or req['type'] == 'field_list':
-                        # Keep table formatting as code block
-                        f.write(f"```text\n{text}\n```\n")
-                    else:
-                        # Regular paragraph
-                        f.write(f"{text}\n")
-
-                    f.write("\n")
-
-                f.write("---\n\n")
-
-            # Write comments by page
-            total_comments = sum(len(cmts) for cmts in self.comments.values())
-            if total_comments > 0:
-                f.write("## Comments & Annotations\n\n")
-
-                for page_key in sorted(self.comments.keys(), key=lambda x: int(x.split('_')[1])):
-                    page_num = page_key.split('_')[1]
-                    comments = self.comments[page_key]
-
-                    if not comments:
-                        continue
+                parts.append(f"### Page {page_num} Comments\n\n")
 
-                    f.write(f"### Page {page_num} Comments\n\n")
+                for comment in comments:
+                    parts.append(f"**[{comment['author']}]** ({comment['type']})\n\n")
+                    parts.append(f"> {comment['text']}\n\n")
 
-                    for comment in comments:
-                        f.write(f"**[{comment['author']}]** ({comment['type']})\n\n")
-                        f.write(f"> {comment['text']}\n\n")
+                parts.append("---\n\n")
 
-                    f.write("---\n\n")
+        with open(markdown_file, 'w', encoding='utf-8') as f:
+            f.write(''.join(parts))
 
-        print(f"✓ Markdown saved to: {markdown_file}")
+        if self.verbose:
+            print(f"✓ Markdown saved to: {markdown_file}")
 
 
 def main():
@@ -603,18 +1452,63 @@ Notes:
         help='Directory to save output JSON files'
     )
 
+    parser.add_argument(
+        '--force-refresh',
+        action='store_true',
+        help='Ignore cached results from earlier runs and re-parse every page'
+    )
+
+    parser.add_argument(
+        '--stream',
+        action='store_true',
+        help='Write JSON output page by page while parsing to limit memory use (skips the Markdown document)'
+    )
+
+    parser.add_argument(
+        '--quiet', '-q',
+        action='store_true',
+        help='Hide the progress bar and progress messages'
+    )
+
+    parser.add_argument(
+        '--ocr-dpi',
+        type=int,
+        default=200,
+        help='Resolution scanned pages are rendered at for OCR (default: 200)'
+    )
+
+    parser.add_argument(
+        '--workers', '-w',
+        type=int,
+        default=None,
+        help='Number of worker processes used to parse pages (default: CPU count)'
+    )
+
     args = parser.parse_args()
 
     try:
         # Initialize and run the parser
-        pdf_parser = PDFRequirementsParser(args.input)
-        requirements, comments = pdf_parser.parse()
-
-        # Save results
-        pdf_parser.save_to_json(args.output_dir)
-        pdf_parser.save_to_markdown(args.output_dir)
-
-        print("\n✅ Processing complete!")
+        pdf_parser = PDFRequirementsParser(
+            args.input,
+            max_workers=args.workers,
+            verbose=not args.quiet,
+            ocr_dpi=args.ocr_dpi
+        )
+
+        if args.stream:
+            # JSON is written page by page while parsing
+            pdf_parser.parse(force_refresh=args.force_refresh, stream_output_dir=args.output_dir)
+            if not args.quiet:
+                print(f"\n✓ Requirements and comments streamed to: {args.output_dir}")
+        else:
+            requirements, comments = pdf_parser.parse(force_refresh=args.force_refresh)
+
+            # Save results
+            pdf_parser.save_to_json(args.output_dir)
+            pdf_parser.save_to_markdown(args.output_dir)
+
+        if not args.quiet:
+            print("\n✅ Processing complete!")
         return 0
 
     except FileNotFoundError as e:
@@ -622,7 +1516,6 @@ Notes:
         return 1
     except Exception as e:
         print(f"❌ Unexpected error: {e}", file=sys.stderr)
-        import traceback
         traceback.print_exc()
         return 1
 